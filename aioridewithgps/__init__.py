@@ -5,6 +5,7 @@ from .exceptions import (
     ApiError,
     AuthenticationError,
     ForbiddenError,
+    NetworkError,
     NotFoundError,
     RideWithGPSError,
 )
@@ -12,9 +13,11 @@ from .models import (
     AuthToken,
     PaginatedResult,
     PaginationMeta,
+    RefreshResult,
     RouteSummary,
     SyncItem,
     SyncResult,
+    SyncState,
     TripSummary,
     User,
 )
@@ -24,14 +27,17 @@ __all__ = [
     "AuthToken",
     "AuthenticationError",
     "ForbiddenError",
+    "NetworkError",
     "NotFoundError",
     "PaginatedResult",
     "PaginationMeta",
+    "RefreshResult",
     "RideWithGPSClient",
     "RideWithGPSError",
     "RouteSummary",
     "SyncItem",
     "SyncResult",
+    "SyncState",
     "TripSummary",
     "User",
 ]
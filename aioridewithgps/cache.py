@@ -0,0 +1,83 @@
+"""Conditional-request cache for the Ride with GPS client.
+
+Single-resource GET responses (the user, one trip or route) that carry
+an ETag or Last-Modified header are kept here along with their parsed
+JSON. The next GET for the same URL sends those validators back
+(If-None-Match / If-Modified-Since); if nothing changed the API answers
+304 Not Modified with an empty body and the cached data is reused,
+saving both the download and the JSON parsing. List pages are not
+cached, to avoid holding a second copy of every record.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """A cached GET response and the validators needed to revalidate it."""
+
+    etag: str | None  # ETag response header, sent back as If-None-Match
+    last_modified: str | None  # Last-Modified header, sent as If-Modified-Since
+    data: Mapping[str, Any]  # Parsed JSON body
+    stored_at: float  # time.monotonic() when the entry was stored/revalidated
+
+
+class ResponseCache:
+    """A size- and age-bounded LRU cache of GET responses, keyed by URL.
+
+    Entries older than ttl seconds are dropped rather than revalidated, so
+    stale validators are never sent. The default TTL matches the 30-minute
+    update interval of the Home Assistant coordinator.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 1800) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of URLs to keep. The least recently
+                used entry is evicted when the cache is full.
+            ttl: Maximum age of an entry in seconds.
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.stored_at > self._ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(
+        self,
+        key: str,
+        data: Mapping[str, Any],
+        etag: str | None,
+        last_modified: str | None,
+    ) -> None:
+        """Store a response, evicting the least recently used if full."""
+        self._entries[key] = CacheEntry(etag, last_modified, data, time.monotonic())
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def touch(self, key: str) -> None:
+        """Mark an entry as freshly revalidated (after a 304 response)."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.stored_at = time.monotonic()
+
+    def discard(self, key: str) -> None:
+        """Remove the entry for key, if there is one."""
+        self._entries.pop(key, None)
@@ -4,104 +4,504 @@ This module provides the main client class for interacting with the
 Ride with GPS REST API (v1). It handles authentication, pagination,
 and parsing API responses into typed dataclass models.
 
+Requests are sent over aiohttp (HTTP/1.1) by default, or over httpx with
+HTTP/2 when an httpx.AsyncClient is passed instead of an aiohttp session
+(see create_http2_session()).
+
 Usage:
-    async with aiohttp.ClientSession() as session:
-        # First authenticate to get a token
-        auth = await RideWithGPSClient.authenticate(
-            session, api_key="...", email="...", password="..."
-        )
+    # Create ONE session for the lifetime of your application and reuse it
+    # for every call. A session keeps a pool of open connections to the API,
+    # so only the first request pays for the TCP + TLS handshake. Opening a
+    # new session per call throws that pool away each time.
+    session = RideWithGPSClient.create_session()
+
+    # First authenticate to get a token
+    auth = await RideWithGPSClient.authenticate(
+        session, api_key="...", email="...", password="..."
+    )
+
+    # Then create a client with the token
+    client = RideWithGPSClient(session, api_key="...", auth_token=auth.auth_token)
+    user = await client.get_user()
+    trips = await client.get_all_trips()
 
-        # Then create a client with the token
-        client = RideWithGPSClient(session, api_key="...", auth_token=auth.auth_token)
-        user = await client.get_user()
-        trips = await client.get_all_trips()
+    # For periodic polling, prefer incremental refreshes over re-fetching
+    # everything: only records changed since the last call are downloaded.
+    state = SyncState()  # or a previously saved state
+    result = await client.refresh_trips(state)  # first call loads everything
+    # ... apply result.changed and result.deleted_ids, then keep
+    # result.state for the next call
+
+    # Close the session when your application shuts down
+    await session.close()
 """
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import json
+import warnings
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote, urlencode
 
 import aiohttp
+from yarl import URL
+
+try:
+    import orjson
+except ImportError:  # orjson is optional (pip install aioridewithgps[speedups])
+    orjson = None  # type: ignore[assignment]
 
-from .exceptions import ApiError, AuthenticationError, ForbiddenError, NotFoundError
+from .cache import ResponseCache
+from .exceptions import (
+    ApiError,
+    AuthenticationError,
+    ForbiddenError,
+    NotFoundError,
+    RideWithGPSError,
+)
 from .models import (
     AuthToken,
     PaginatedResult,
     PaginationMeta,
+    RefreshResult,
     RouteSummary,
     SyncItem,
     SyncResult,
+    SyncState,
     TripSummary,
     User,
 )
+from .transport import get_transport
+
+if TYPE_CHECKING:
+    import httpx
 
 # Base URL for all RWGPS API v1 endpoints
 API_BASE_URL = "https://ridewithgps.com/api/v1"
 
+# Pre-parsed URLs for the fixed endpoints. Passing a yarl.URL straight to
+# the HTTP library skips building and re-parsing the URL string on every
+# request. Single-record URLs are built with yarl's "/" operator, e.g.
+# _URL_TRIPS_DIR / "123.json".
+_API_BASE_PATH = URL(API_BASE_URL).path  # "/api/v1"
+_URL_AUTH_TOKENS = URL(f"{API_BASE_URL}/auth_tokens.json")
+_URL_USER_CURRENT = URL(f"{API_BASE_URL}/users/current.json")
+_URL_TRIPS = URL(f"{API_BASE_URL}/trips.json")
+_URL_TRIPS_DIR = URL(f"{API_BASE_URL}/trips")
+_URL_ROUTES = URL(f"{API_BASE_URL}/routes.json")
+_URL_ROUTES_DIR = URL(f"{API_BASE_URL}/routes")
+_URL_SYNC = URL(f"{API_BASE_URL}/sync.json")
+
+
+def _with_query(url: URL, query: str) -> URL:
+    """Attach an already percent-encoded query string to a pre-parsed URL.
+
+    Used on the hot paginated/sync paths in place of params={...}, which
+    has the HTTP library walk a dict and encode every key and value on
+    each call. The URL is created with encoded=True so yarl takes the
+    string as-is instead of re-quoting it.
+    """
+    return URL(f"{url}?{query}", encoded=True)
+
+
+# Sync actions meaning the item no longer exists for the user
+_SYNC_REMOVED_ACTIONS = frozenset({"deleted", "removed"})
+
+# A fresh SyncState (epoch cursor) means nothing has been loaded yet
+_INITIAL_SYNC_STATE = SyncState()
+
+# Default number of page requests allowed in flight at once
+DEFAULT_MAX_CONCURRENCY = 5
+
+# Connection pool settings used by create_session(). All requests go to a
+# single host, so a small pool of keep-alive connections is enough.
+SESSION_CONNECTION_LIMIT = 20
+SESSION_CONNECTION_LIMIT_PER_HOST = 10
+SESSION_DNS_CACHE_TTL = 300  # seconds
+SESSION_KEEPALIVE_TIMEOUT = 75  # seconds
+
+# Connection pool settings used by create_http2_session(). With HTTP/2 the
+# concurrent requests share one multiplexed connection per host.
+HTTP2_MAX_CONNECTIONS = 20
+HTTP2_MAX_KEEPALIVE_CONNECTIONS = 10
+
+# Conditional GET cache bounds: number of URLs kept, and their maximum age
+# in seconds (matches the 30-minute coordinator update interval)
+RESPONSE_CACHE_SIZE = 256
+RESPONSE_CACHE_TTL = 1800
+
+# Maximum number of distinct GETs tracked for in-flight de-duplication.
+# Beyond this, new requests are simply sent without being shared.
+MAX_INFLIGHT_REQUESTS = 256
+
+# HTTP status -> factory for the exception raised by _request(). Each factory
+# takes the API path relative to API_BASE_URL (used in the 404 message).
+# Any other status >= 400 becomes a generic ApiError.
+_STATUS_EXCEPTIONS: dict[int, Callable[[str], RideWithGPSError]] = {
+    401: lambda path: AuthenticationError("Authentication failed"),
+    403: lambda path: ForbiddenError("Access forbidden"),
+    404: lambda path: NotFoundError(f"Resource not found: {path}"),
+}
+
+# Shared read-only result for 204 No Content responses
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _check_limit(limit: int) -> None:
+    """Reject concurrency limits that would deadlock or break a Semaphore."""
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+
+
+@dataclass(slots=True)
+class _InFlight:
+    """A GET request shared by every caller currently waiting on it."""
+
+    task: asyncio.Future[Mapping[str, Any]]
+    waiters: int = 0  # Callers currently awaiting the task
+
+
+def _json_loads(body: bytes) -> Any:
+    """Parse a JSON response body, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize a JSON request body, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def _json_body(headers: Mapping[str, str], data: Any) -> tuple[dict[str, str], bytes]:
+    """Pre-serialize a JSON request body and build the headers to send it.
+
+    The body is encoded to bytes once (with orjson when available) and
+    passed to the HTTP library as raw data, so it never runs its own
+    stdlib json.dumps. Returns a copy of headers with the Content-Type
+    and Content-Length of the body filled in, plus the body itself.
+    """
+    body = _json_dumps(data)
+    return {
+        **headers,
+        "Content-Type": "application/json",
+        "Content-Length": str(len(body)),
+    }, body
+
+
+# Sentinel default marking fields that must be present in the API response
+_REQUIRED: Any = object()
+
+# (json_key, default) pairs for each model, in dataclass field order.
+# Fields with a _REQUIRED default raise KeyError if the API omits them.
+_USER_FIELDS: tuple[tuple[str, Any], ...] = (
+    ("id", _REQUIRED),
+    ("email", ""),
+    ("first_name", ""),
+    ("last_name", ""),
+    ("display_name", ""),
+    ("created_at", ""),
+    ("updated_at", ""),
+)
+
+_TRIP_FIELDS: tuple[tuple[str, Any], ...] = (
+    ("id", _REQUIRED),
+    ("user_id", _REQUIRED),
+    ("name", ""),
+    ("distance", 0),
+    ("duration", 0),
+    ("moving_time", 0),
+    ("elevation_gain", 0),
+    ("elevation_loss", 0),
+    ("created_at", ""),
+    ("updated_at", ""),
+    ("visibility", ""),
+    ("stationary", False),
+    ("description", None),
+    ("departed_at", None),
+    ("time_zone", None),
+    ("locality", None),
+    ("administrative_area", None),
+    ("country_code", None),
+    ("activity_type", None),
+    ("avg_speed", None),
+    ("max_speed", None),
+    ("avg_hr", None),
+    ("min_hr", None),
+    ("max_hr", None),
+    ("avg_cad", None),
+    ("min_cad", None),
+    ("max_cad", None),
+    ("avg_watts", None),
+    ("min_watts", None),
+    ("max_watts", None),
+    ("calories", None),
+    ("first_lat", None),
+    ("first_lng", None),
+    ("last_lat", None),
+    ("last_lng", None),
+    ("sw_lat", None),
+    ("sw_lng", None),
+    ("ne_lat", None),
+    ("ne_lng", None),
+    ("track_type", None),
+    ("terrain", None),
+    ("difficulty", None),
+    ("device", None),
+    ("url", None),
+    ("web_url", None),
+    ("html_url", None),
+)
+
+_ROUTE_FIELDS: tuple[tuple[str, Any], ...] = (
+    ("id", _REQUIRED),
+    ("user_id", _REQUIRED),
+    ("name", ""),
+    ("distance", 0),
+    ("elevation_gain", 0),
+    ("elevation_loss", 0),
+    ("created_at", ""),
+    ("updated_at", ""),
+    ("visibility", ""),
+    ("description", None),
+    ("locality", None),
+    ("administrative_area", None),
+    ("country_code", None),
+    ("first_lat", None),
+    ("first_lng", None),
+    ("last_lat", None),
+    ("last_lng", None),
+    ("sw_lat", None),
+    ("sw_lng", None),
+    ("ne_lat", None),
+    ("ne_lng", None),
+    ("track_type", None),
+    ("terrain", None),
+    ("difficulty", None),
+    ("unpaved_pct", None),
+    ("surface", None),
+    ("archived", None),
+    ("url", None),
+    ("html_url", None),
+)
+
+_SYNC_ITEM_FIELDS: tuple[tuple[str, Any], ...] = (
+    ("item_type", _REQUIRED),
+    ("item_id", _REQUIRED),
+    ("item_user_id", _REQUIRED),
+    ("action", _REQUIRED),
+    ("datetime", _REQUIRED),
+    ("item_url", None),
+)
+
+
+def _compile_parser[M](
+    cls: Callable[..., M], fields: tuple[tuple[str, Any], ...]
+) -> Callable[[dict[str, Any]], M]:
+    """Generate a specialized parse function for a model from its field table.
+
+    Parsing runs once per record on the list endpoints (thousands of times
+    for get_all_trips()), so rather than looping over the table for every
+    record, this builds the source of a function with every lookup written
+    out and compiles it once at import time. For the trip table the result
+    is equivalent to:
+
+        def parse(d, _cls=TripSummary, _get=dict.get, _d2="", ...):
+            return _cls(id=d["id"], user_id=d["user_id"],
+                        name=_get(d, "name", _d2), ...)
+
+    The model class, dict.get and all defaults are bound as default
+    arguments so they are fast local lookups inside the function.
+    """
+    bindings: dict[str, Any] = {"_cls": cls, "_get": dict.get}
+    kwargs = []
+    for n, (key, default) in enumerate(fields):
+        if default is _REQUIRED:
+            kwargs.append(f"{key}=d[{key!r}]")
+        else:
+            bindings[f"_d{n}"] = default
+            kwargs.append(f"{key}=_get(d, {key!r}, _d{n})")
+
+    params = ", ".join(f"{name}={name}" for name in bindings)
+    src = f"def parse(d, {params}):\n    return _cls({', '.join(kwargs)})\n"
+    namespace: dict[str, Any] = {}
+    exec(src, dict(bindings), namespace)
+
+    parse = namespace["parse"]
+    parse.__name__ = parse.__qualname__ = f"parse_{cls.__name__}"
+    parse.__doc__ = f"Parse an API dict into a {cls.__name__} dataclass."
+    return parse
+
 
 class RideWithGPSClient:
     """Async client for the Ride with GPS API v1.
 
-    This client uses aiohttp for async HTTP requests and authenticates
-    using the RWGPS custom header scheme (x-rwgps-api-key + x-rwgps-auth-token).
+    This client uses aiohttp (or optionally httpx, for HTTP/2) for async
+    HTTP requests and authenticates using the RWGPS custom header scheme
+    (x-rwgps-api-key + x-rwgps-auth-token).
 
-    The client does NOT manage its own aiohttp session - you must provide one.
+    The client does NOT manage its own HTTP session - you must provide one.
     This allows the caller (e.g., Home Assistant) to manage session lifecycle.
+    The session should live as long as your application so its connections
+    are reused; see create_session() for a suitably configured one.
     """
 
     def __init__(
         self,
-        session: aiohttp.ClientSession,
+        session: aiohttp.ClientSession | httpx.AsyncClient,
         api_key: str,
         auth_token: str,
     ) -> None:
         """Initialize the client.
 
         Args:
-            session: An aiohttp session to use for HTTP requests.
+            session: An aiohttp session, or an httpx AsyncClient for HTTP/2,
+                to use for HTTP requests.
             api_key: Your RWGPS API key (identifies the application).
             auth_token: The user's auth token (obtained via authenticate()).
         """
         self._session = session
+        self._http = get_transport(session)
         self._api_key = api_key
         self._auth_token = auth_token
 
-    @property
-    def _headers(self) -> dict[str, str]:
-        """Build the authentication headers for API requests.
+        connector = getattr(session, "connector", None)
+        if connector is not None and connector.limit_per_host == 1:
+            warnings.warn(
+                "The aiohttp session only allows one connection per host, "
+                "so paginated requests will run one at a time",
+                stacklevel=2,
+            )
+
+        # Authentication headers sent with every API request. They never
+        # change for the life of the client, so build them once here. The
+        # mapping is read-only because concurrent requests share it.
+        #
+        # RWGPS uses a custom header scheme instead of standard Authorization:
+        # - x-rwgps-api-key: identifies the API client/application
+        # - x-rwgps-auth-token: identifies the authenticated user
+        self._headers: Mapping[str, str] = MappingProxyType(
+            {
+                "x-rwgps-api-key": api_key,
+                "x-rwgps-auth-token": auth_token,
+                "Content-Type": "application/json",
+            }
+        )
+
+        # ETag/Last-Modified validators and parsed bodies of single-resource
+        # GET responses, so repeat fetches of unchanged data come back as
+        # cheap 304s
+        self._etag_cache = ResponseCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL)
+
+        # GET requests currently in flight, keyed like the ETag cache, so
+        # concurrent identical GETs share one HTTP request
+        self._inflight: dict[str, _InFlight] = {}
 
-        RWGPS uses a custom header scheme instead of standard Authorization:
-        - x-rwgps-api-key: identifies the API client/application
-        - x-rwgps-auth-token: identifies the authenticated user
+    @classmethod
+    def create_session(cls) -> aiohttp.ClientSession:
+        """Create an aiohttp session tuned for the Ride with GPS API.
+
+        The session keeps a pool of keep-alive connections to the API host
+        and caches its DNS lookup, so after the first request later calls
+        skip the TCP and TLS handshakes. Create it once, share it across
+        all clients, and close it when your application shuts down.
+
+        Must be called from within a running event loop.
+
+        Returns:
+            A new aiohttp session. The caller owns it and must close it.
+        """
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=SESSION_CONNECTION_LIMIT,
+                limit_per_host=SESSION_CONNECTION_LIMIT_PER_HOST,
+                ttl_dns_cache=SESSION_DNS_CACHE_TTL,
+                keepalive_timeout=SESSION_KEEPALIVE_TIMEOUT,
+            )
+        )
+
+    @classmethod
+    def create_http2_session(cls) -> httpx.AsyncClient:
+        """Create an httpx client that talks to the API over HTTP/2.
+
+        Over HTTP/2 all concurrent requests (e.g., the pages fetched by
+        get_all_trips()) are multiplexed on one connection, so they share
+        a single TCP + TLS handshake. Pass the result anywhere an aiohttp
+        session is accepted. Like create_session(), create it once and
+        close it (await client.aclose()) when your application shuts down.
+
+        Requires the optional http2 extra: pip install aioridewithgps[http2]
+
+        Connection failures and timeouts raise NetworkError with either
+        backend (it also subclasses aiohttp.ClientError), never raw httpx
+        exceptions, so error handling doesn't change when switching.
+
+        Returns:
+            A new httpx AsyncClient. The caller owns it and must close it.
+
+        Raises:
+            ImportError: If httpx (with HTTP/2 support) isn't installed.
         """
-        return {
-            "x-rwgps-api-key": self._api_key,
-            "x-rwgps-auth-token": self._auth_token,
-            "Content-Type": "application/json",
-        }
+        try:
+            import httpx
+        except ImportError as err:
+            raise ImportError(
+                "HTTP/2 support requires httpx: pip install aioridewithgps[http2]"
+            ) from err
+
+        return httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=HTTP2_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP2_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
 
     async def _request(
         self,
         method: str,
-        path: str,
+        path: str | URL,
         params: dict[str, Any] | None = None,
         json_data: dict[str, Any] | None = None,
-        headers: dict[str, str] | None = None,
-    ) -> dict[str, Any]:
+        headers: Mapping[str, str] | None = None,
+        cache: bool = False,
+    ) -> Mapping[str, Any]:
         """Make an authenticated API request and handle errors.
 
         All API methods go through this to get consistent error handling.
         Maps HTTP status codes to specific exception types.
 
+        With cache=True, a GET response carrying an ETag or Last-Modified
+        header is cached. Repeat GETs for the same URL are sent as
+        conditional requests, and a 304 Not Modified reply returns the
+        cached data. Only small single-resource fetches (the user, one
+        trip or route) opt in; list pages are never cached, so fetching
+        every page doesn't keep a second copy of all the records.
+
+        Identical GETs made while one is already in flight don't send a
+        second request; they wait for the first and share its result (or
+        exception). Because results may be shared with the cache and with
+        other callers, the returned mapping is a read-only view; nested
+        dicts and lists inside it are shared too and must not be mutated.
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE).
-            path: API path (e.g., "/trips.json") - appended to API_BASE_URL.
+            path: API path (e.g., "/trips.json") - appended to API_BASE_URL -
+                or a complete, pre-parsed URL (e.g., _URL_TRIPS) used as-is.
             params: Optional query string parameters.
             json_data: Optional JSON request body.
             headers: Optional headers override (defaults to auth headers).
+            cache: Whether to use the conditional GET cache for this URL.
 
         Returns:
-            Parsed JSON response as a dict.
+            Parsed JSON response as a read-only MappingProxyType view
+            (empty for 204).
 
         Raises:
             AuthenticationError: If the API returns 401.
@@ -109,25 +509,119 @@ class RideWithGPSClient:
             NotFoundError: If the API returns 404.
             ApiError: For any other HTTP error (4xx/5xx).
         """
-        url = f"{API_BASE_URL}{path}"
+        url: str | URL
+        if isinstance(path, URL):
+            # Keep error messages in the relative form, e.g. "/trips/1.json"
+            url, path = path, path.path.removeprefix(_API_BASE_PATH)
+        else:
+            url = f"{API_BASE_URL}{path}"
+        if method != "GET":
+            return await self._send(method, url, path, params, json_data, headers)
+
+        request_key = f"{url}?{urlencode(params)}" if params else str(url)
+        cache_key = request_key if cache else None
+        if headers is not None or len(self._inflight) >= MAX_INFLIGHT_REQUESTS:
+            return await self._send(
+                method, url, path, params, json_data, headers, cache_key
+            )
+
+        entry = self._inflight.get(request_key)
+        if entry is None:
+            task = asyncio.ensure_future(
+                self._send(method, url, path, params, json_data, headers, cache_key)
+            )
+            entry = _InFlight(task)
+            self._inflight[request_key] = entry
+            entry.task.add_done_callback(
+                lambda done: self._request_finished(request_key, done)
+            )
+
+        # Shield the shared request so one caller being cancelled doesn't
+        # cancel it for the others still waiting on it. Once the last
+        # waiter is cancelled, nobody needs the result, so cancel the
+        # request itself.
+        entry.waiters += 1
+        try:
+            return await asyncio.shield(entry.task)
+        except asyncio.CancelledError:
+            entry.waiters -= 1
+            if entry.waiters == 0 and not entry.task.done():
+                entry.task.cancel()
+                # Don't hand the cancelled request to new callers
+                if self._inflight.get(request_key) is entry:
+                    del self._inflight[request_key]
+            raise
+
+    def _request_finished(
+        self, key: str, task: asyncio.Future[Mapping[str, Any]]
+    ) -> None:
+        """Remove a finished request from the in-flight map."""
+        entry = self._inflight.get(key)
+        if entry is not None and entry.task is task:
+            del self._inflight[key]
+        # Mark any exception as retrieved; if every waiter was cancelled
+        # nobody else will, and asyncio would log it as never retrieved
+        if not task.cancelled():
+            task.exception()
+
+    async def _send(
+        self,
+        method: str,
+        url: str | URL,
+        path: str,
+        params: dict[str, Any] | None,
+        json_data: dict[str, Any] | None,
+        headers: Mapping[str, str] | None,
+        cache_key: str | None = None,
+    ) -> Mapping[str, Any]:
+        """Send one request and turn the response into data or an exception.
+
+        Does the work for _request(). When cache_key is given, the response
+        is looked up in and stored to the conditional GET cache under it.
+        """
         request_headers = headers or self._headers
 
-        async with self._session.request(
-            method, url, headers=request_headers, params=params, json=json_data
-        ) as resp:
-            if resp.status == 401:
-                raise AuthenticationError("Authentication failed")
-            if resp.status == 403:
-                raise ForbiddenError("Access forbidden")
-            if resp.status == 404:
-                raise NotFoundError(f"Resource not found: {path}")
-            if resp.status >= 400:
-                body = await resp.text()
-                raise ApiError(resp.status, body)
-            # 204 No Content (e.g., after DELETE) - return empty dict
-            if resp.status == 204:
-                return {}
-            return await resp.json()
+        body = None
+        if json_data is not None:
+            request_headers, body = _json_body(request_headers, json_data)
+
+        cached = None
+        if cache_key is not None:
+            cached = self._etag_cache.get(cache_key)
+            if cached is not None:
+                request_headers = dict(request_headers)
+                if cached.etag is not None:
+                    request_headers["If-None-Match"] = cached.etag
+                if cached.last_modified is not None:
+                    request_headers["If-Modified-Since"] = cached.last_modified
+
+        resp = await self._http.request(
+            method, url, headers=request_headers, params=params, data=body
+        )
+        # 304 Not Modified - our cached copy is still current
+        if resp.status == 304 and cache_key is not None and cached is not None:
+            self._etag_cache.touch(cache_key)
+            return cached.data
+        if resp.status >= 400:
+            exc_factory = _STATUS_EXCEPTIONS.get(resp.status)
+            if exc_factory is not None:
+                raise exc_factory(path)
+            raise ApiError(resp.status, resp.text)
+        # 204 No Content (e.g., after DELETE) - return empty mapping
+        if resp.status == 204:
+            return _EMPTY
+
+        data: Mapping[str, Any] = MappingProxyType(_json_loads(resp.body))
+        if cache_key is not None:
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            if etag is not None or last_modified is not None:
+                self._etag_cache.put(cache_key, data, etag, last_modified)
+            else:
+                # The resource no longer has validators - don't keep
+                # sending the old ones
+                self._etag_cache.discard(cache_key)
+        return data
 
     # -------------------------------------------------------------------------
     # Authentication
@@ -135,7 +629,7 @@ class RideWithGPSClient:
 
     @staticmethod
     async def authenticate(
-        session: aiohttp.ClientSession,
+        session: aiohttp.ClientSession | httpx.AsyncClient,
         api_key: str,
         email: str,
         password: str,
@@ -150,7 +644,7 @@ class RideWithGPSClient:
         Only the returned auth token should be persisted.
 
         Args:
-            session: An aiohttp session.
+            session: An aiohttp session or httpx AsyncClient.
             api_key: Your RWGPS API key.
             email: User's RWGPS account email.
             password: User's RWGPS account password.
@@ -162,43 +656,30 @@ class RideWithGPSClient:
             AuthenticationError: If credentials are invalid.
             ApiError: For unexpected API errors.
         """
-        url = f"{API_BASE_URL}/auth_tokens.json"
-        headers = {
-            "x-rwgps-api-key": api_key,
-            "Content-Type": "application/json",
-        }
-        async with session.post(
-            url,
-            headers=headers,
-            json={"user": {"email": email, "password": password}},
-        ) as resp:
-            if resp.status == 401:
-                raise AuthenticationError("Invalid email or password")
-            if resp.status == 400:
-                raise AuthenticationError("Bad request - check credentials")
-            if resp.status >= 400:
-                body = await resp.text()
-                raise ApiError(resp.status, body)
-
-            data = await resp.json()
+        headers, body = _json_body(
+            {"x-rwgps-api-key": api_key},
+            {"user": {"email": email, "password": password}},
+        )
+        resp = await get_transport(session).request(
+            "POST", _URL_AUTH_TOKENS, headers=headers, data=body
+        )
+        if resp.status == 401:
+            raise AuthenticationError("Invalid email or password")
+        if resp.status == 400:
+            raise AuthenticationError("Bad request - check credentials")
+        if resp.status >= 400:
+            raise ApiError(resp.status, resp.text)
+
+        data = _json_loads(resp.body)
 
         # Response format: {"auth_token": {"auth_token": "...", "user": {...}}}
         # Note: the outer and inner keys are both named "auth_token"
         auth_data = data["auth_token"]
-        user_data = auth_data["user"]
 
         return AuthToken(
             auth_token=auth_data["auth_token"],
             api_key=auth_data["api_key"],
-            user=User(
-                id=user_data["id"],
-                email=user_data.get("email", ""),
-                first_name=user_data.get("first_name", ""),
-                last_name=user_data.get("last_name", ""),
-                display_name=user_data.get("display_name", ""),
-                created_at=user_data.get("created_at", ""),
-                updated_at=user_data.get("updated_at", ""),
-            ),
+            user=RideWithGPSClient._parse_user(auth_data["user"]),
             created_at=auth_data.get("created_at"),
             updated_at=auth_data.get("updated_at"),
         )
@@ -213,75 +694,21 @@ class RideWithGPSClient:
         Returns:
             A User object with the account details.
         """
-        data = await self._request("GET", "/users/current.json")
-        u = data["user"]
-        return User(
-            id=u["id"],
-            email=u.get("email", ""),
-            first_name=u.get("first_name", ""),
-            last_name=u.get("last_name", ""),
-            display_name=u.get("display_name", ""),
-            created_at=u.get("created_at", ""),
-            updated_at=u.get("updated_at", ""),
-        )
+        data = await self._request("GET", _URL_USER_CURRENT, cache=True)
+        return self._parse_user(data["user"])
+
+    # Parse a user dict from the API into a User dataclass.
+    # Generated from _USER_FIELDS at import time; see _compile_parser().
+    _parse_user = staticmethod(_compile_parser(User, _USER_FIELDS))
 
     # -------------------------------------------------------------------------
     # Trips (recorded rides)
     # -------------------------------------------------------------------------
 
-    def _parse_trip_summary(self, t: dict[str, Any]) -> TripSummary:
-        """Parse a trip summary dict from the API into a TripSummary dataclass.
-
-        Handles missing/null fields gracefully with .get() defaults.
-        """
-        return TripSummary(
-            id=t["id"],
-            user_id=t["user_id"],
-            name=t.get("name", ""),
-            distance=t.get("distance", 0),
-            duration=t.get("duration", 0),
-            moving_time=t.get("moving_time", 0),
-            elevation_gain=t.get("elevation_gain", 0),
-            elevation_loss=t.get("elevation_loss", 0),
-            created_at=t.get("created_at", ""),
-            updated_at=t.get("updated_at", ""),
-            visibility=t.get("visibility", ""),
-            stationary=t.get("stationary", False),
-            description=t.get("description"),
-            departed_at=t.get("departed_at"),
-            time_zone=t.get("time_zone"),
-            locality=t.get("locality"),
-            administrative_area=t.get("administrative_area"),
-            country_code=t.get("country_code"),
-            activity_type=t.get("activity_type"),
-            avg_speed=t.get("avg_speed"),
-            max_speed=t.get("max_speed"),
-            avg_hr=t.get("avg_hr"),
-            min_hr=t.get("min_hr"),
-            max_hr=t.get("max_hr"),
-            avg_cad=t.get("avg_cad"),
-            min_cad=t.get("min_cad"),
-            max_cad=t.get("max_cad"),
-            avg_watts=t.get("avg_watts"),
-            min_watts=t.get("min_watts"),
-            max_watts=t.get("max_watts"),
-            calories=t.get("calories"),
-            first_lat=t.get("first_lat"),
-            first_lng=t.get("first_lng"),
-            last_lat=t.get("last_lat"),
-            last_lng=t.get("last_lng"),
-            sw_lat=t.get("sw_lat"),
-            sw_lng=t.get("sw_lng"),
-            ne_lat=t.get("ne_lat"),
-            ne_lng=t.get("ne_lng"),
-            track_type=t.get("track_type"),
-            terrain=t.get("terrain"),
-            difficulty=t.get("difficulty"),
-            device=t.get("device"),
-            url=t.get("url"),
-            web_url=t.get("web_url"),
-            html_url=t.get("html_url"),
-        )
+    # Parse a trip summary dict from the API into a TripSummary dataclass.
+    # Missing optional fields get their table defaults.
+    # Generated from _TRIP_FIELDS at import time; see _compile_parser().
+    _parse_trip_summary = staticmethod(_compile_parser(TripSummary, _TRIP_FIELDS))
 
     async def get_trips(
         self, page: int = 1, page_size: int = 200
@@ -295,34 +722,56 @@ class RideWithGPSClient:
         Returns:
             A PaginatedResult containing the trips and pagination metadata.
         """
+        # The keys are fixed and the values are ints, so the query string
+        # is already encoded - no need to pass it through a params encoder
         data = await self._request(
-            "GET",
-            "/trips.json",
-            params={"page": page, "page_size": page_size},
+            "GET", _with_query(_URL_TRIPS, f"page={page}&page_size={page_size}")
         )
         trips = [self._parse_trip_summary(t) for t in data.get("trips", [])]
         pagination = self._parse_pagination(data.get("meta", {}))
         return PaginatedResult(items=trips, pagination=pagination)
 
-    async def get_all_trips(self) -> list[TripSummary]:
+    async def get_all_trips(
+        self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> list[TripSummary]:
         """Fetch ALL trips by paginating through every page.
 
         Uses max page size (200) to minimize API calls.
-        For a user with 1000 trips, this makes ~5 API calls.
+        For a user with 1000 trips, this makes ~5 API calls. The first
+        page tells us how many pages there are; the rest are fetched
+        concurrently.
+
+        Args:
+            max_concurrency: Maximum number of page requests in flight at once.
 
         Returns:
             Complete list of all user's trips.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
         """
-        all_trips: list[TripSummary] = []
-        page = 1
-        while True:
-            result = await self.get_trips(page=page, page_size=200)
-            all_trips.extend(result.items)
-            # next_page_url is null when we've reached the last page
-            if result.pagination.next_page_url is None:
-                break
-            page += 1
-        return all_trips
+        return await self._fetch_all_pages(self.get_trips, max_concurrency)
+
+    async def iter_trips(self, page_size: int = 200) -> AsyncIterator[TripSummary]:
+        """Iterate over ALL trips, one page at a time.
+
+        Unlike get_all_trips(), only the current page is held in memory,
+        and breaking out of the loop early skips fetching the remaining
+        pages. Pages are fetched sequentially, so reading every trip is
+        slower than get_all_trips().
+
+        Usage:
+            async for trip in client.iter_trips():
+                ...
+
+        Args:
+            page_size: Number of trips per page (20-200).
+
+        Yields:
+            Each of the user's trips, in API order.
+        """
+        async for trip in self._iter_pages(self.get_trips, page_size):
+            yield trip
 
     async def get_trip(self, trip_id: int) -> TripSummary:
         """Get a single trip by its ID.
@@ -339,46 +788,40 @@ class RideWithGPSClient:
         Raises:
             NotFoundError: If the trip doesn't exist.
         """
-        data = await self._request("GET", f"/trips/{trip_id}.json")
+        data = await self._request(
+            "GET", _URL_TRIPS_DIR / f"{trip_id}.json", cache=True
+        )
         return self._parse_trip_summary(data["trip"])
 
+    async def get_trips_by_ids(
+        self, trip_ids: Iterable[int], concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> list[TripSummary]:
+        """Get several trips by ID, fetching them concurrently.
+
+        This is the preferred follow-up to get_sync(): fetch the trips it
+        reports as created/updated in one batch rather than calling
+        get_trip() for each one in turn.
+
+        Args:
+            trip_ids: The RWGPS trip IDs to fetch.
+            concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            The trip summaries, in the same order as trip_ids.
+
+        Raises:
+            NotFoundError: If any of the trips doesn't exist.
+            ValueError: If concurrency is less than 1.
+        """
+        return await self._gather_limited(self.get_trip, trip_ids, concurrency)
+
     # -------------------------------------------------------------------------
     # Routes (planned routes)
     # -------------------------------------------------------------------------
 
-    def _parse_route_summary(self, r: dict[str, Any]) -> RouteSummary:
-        """Parse a route summary dict from the API into a RouteSummary dataclass."""
-        return RouteSummary(
-            id=r["id"],
-            user_id=r["user_id"],
-            name=r.get("name", ""),
-            distance=r.get("distance", 0),
-            elevation_gain=r.get("elevation_gain", 0),
-            elevation_loss=r.get("elevation_loss", 0),
-            created_at=r.get("created_at", ""),
-            updated_at=r.get("updated_at", ""),
-            visibility=r.get("visibility", ""),
-            description=r.get("description"),
-            locality=r.get("locality"),
-            administrative_area=r.get("administrative_area"),
-            country_code=r.get("country_code"),
-            first_lat=r.get("first_lat"),
-            first_lng=r.get("first_lng"),
-            last_lat=r.get("last_lat"),
-            last_lng=r.get("last_lng"),
-            sw_lat=r.get("sw_lat"),
-            sw_lng=r.get("sw_lng"),
-            ne_lat=r.get("ne_lat"),
-            ne_lng=r.get("ne_lng"),
-            track_type=r.get("track_type"),
-            terrain=r.get("terrain"),
-            difficulty=r.get("difficulty"),
-            unpaved_pct=r.get("unpaved_pct"),
-            surface=r.get("surface"),
-            archived=r.get("archived"),
-            url=r.get("url"),
-            html_url=r.get("html_url"),
-        )
+    # Parse a route summary dict from the API into a RouteSummary dataclass.
+    # Generated from _ROUTE_FIELDS at import time; see _compile_parser().
+    _parse_route_summary = staticmethod(_compile_parser(RouteSummary, _ROUTE_FIELDS))
 
     async def get_routes(
         self, page: int = 1, page_size: int = 200
@@ -393,29 +836,83 @@ class RideWithGPSClient:
             A PaginatedResult containing the routes and pagination metadata.
         """
         data = await self._request(
-            "GET",
-            "/routes.json",
-            params={"page": page, "page_size": page_size},
+            "GET", _with_query(_URL_ROUTES, f"page={page}&page_size={page_size}")
         )
         routes = [self._parse_route_summary(r) for r in data.get("routes", [])]
         pagination = self._parse_pagination(data.get("meta", {}))
         return PaginatedResult(items=routes, pagination=pagination)
 
-    async def get_all_routes(self) -> list[RouteSummary]:
+    async def get_all_routes(
+        self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> list[RouteSummary]:
         """Fetch ALL routes by paginating through every page.
 
+        Args:
+            max_concurrency: Maximum number of page requests in flight at once.
+
         Returns:
             Complete list of all user's planned routes.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
         """
-        all_routes: list[RouteSummary] = []
-        page = 1
-        while True:
-            result = await self.get_routes(page=page, page_size=200)
-            all_routes.extend(result.items)
-            if result.pagination.next_page_url is None:
-                break
-            page += 1
-        return all_routes
+        return await self._fetch_all_pages(self.get_routes, max_concurrency)
+
+    async def iter_routes(self, page_size: int = 200) -> AsyncIterator[RouteSummary]:
+        """Iterate over ALL routes, one page at a time.
+
+        The route counterpart of iter_trips(): only the current page is
+        held in memory, and breaking out early skips the remaining pages.
+
+        Args:
+            page_size: Number of routes per page (20-200).
+
+        Yields:
+            Each of the user's planned routes, in API order.
+        """
+        async for route in self._iter_pages(self.get_routes, page_size):
+            yield route
+
+    async def get_route(self, route_id: int) -> RouteSummary:
+        """Get a single route by its ID.
+
+        Returns summary data (no track points). Used for fetching
+        updated route data after a sync notification.
+
+        Args:
+            route_id: The RWGPS route ID.
+
+        Returns:
+            The route summary.
+
+        Raises:
+            NotFoundError: If the route doesn't exist.
+        """
+        data = await self._request(
+            "GET", _URL_ROUTES_DIR / f"{route_id}.json", cache=True
+        )
+        return self._parse_route_summary(data["route"])
+
+    async def get_routes_by_ids(
+        self, route_ids: Iterable[int], concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> list[RouteSummary]:
+        """Get several routes by ID, fetching them concurrently.
+
+        The route counterpart of get_trips_by_ids(), for following up on
+        the routes reported by get_sync().
+
+        Args:
+            route_ids: The RWGPS route IDs to fetch.
+            concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            The route summaries, in the same order as route_ids.
+
+        Raises:
+            NotFoundError: If any of the routes doesn't exist.
+            ValueError: If concurrency is less than 1.
+        """
+        return await self._gather_limited(self.get_route, route_ids, concurrency)
 
     # -------------------------------------------------------------------------
     # Sync (incremental updates)
@@ -430,6 +927,11 @@ class RideWithGPSClient:
         trips and routes without re-fetching everything. The coordinator
         calls this on each update interval (e.g., every 30 minutes).
 
+        To load the records that changed, pass the item IDs to
+        get_trips_by_ids() / get_routes_by_ids() rather than fetching
+        them one at a time, or use refresh_trips() / refresh_routes(),
+        which do both steps.
+
         Args:
             since: ISO 8601 datetime string. Use "1970-01-01T00:00:00Z"
                    for initial sync, or the rwgps_datetime from the
@@ -441,22 +943,11 @@ class RideWithGPSClient:
             A SyncResult with the list of changes and the server timestamp
             to use for the next sync call.
         """
-        data = await self._request(
-            "GET",
-            "/sync.json",
-            params={"since": since, "assets": assets},
-        )
-        items = [
-            SyncItem(
-                item_type=i["item_type"],
-                item_id=i["item_id"],
-                item_user_id=i["item_user_id"],
-                action=i["action"],
-                datetime=i["datetime"],
-                item_url=i.get("item_url"),
-            )
-            for i in data.get("items", [])
-        ]
+        # Percent-encode both values here (e.g., "+" in a timezone offset),
+        # keeping the commas that separate asset types
+        query = f"since={quote(since, safe='')}&assets={quote(assets, safe=',')}"
+        data = await self._request("GET", _with_query(_URL_SYNC, query))
+        items = [self._parse_sync_item(i) for i in data.get("items", [])]
         meta = data.get("meta", {})
         return SyncResult(
             items=items,
@@ -464,10 +955,226 @@ class RideWithGPSClient:
             next_sync_url=meta.get("next_sync_url"),
         )
 
+    async def refresh_trips(
+        self, state: SyncState, concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> RefreshResult[TripSummary]:
+        """Fetch only the trips that changed since the given state.
+
+        This is the recommended way to poll for updates. It costs one sync
+        call plus one request per changed trip, instead of re-fetching
+        every page like get_all_trips(). Pass the returned state into the
+        next call.
+
+        Given a fresh SyncState(), there is no previous state to diff
+        against, so the first call loads every trip through the paginated
+        list (the same requests as get_all_trips()) rather than one
+        request per trip, and returns them all as changed.
+
+        Args:
+            state: Where the previous refresh left off.
+            concurrency: Maximum number of trip requests in flight at once.
+
+        Returns:
+            The created/updated trips, the IDs of deleted trips, and the
+            state to pass to the next refresh.
+
+        Raises:
+            ValueError: If concurrency is less than 1.
+        """
+        return await self._refresh(
+            state, "trip", self.get_trip, self.get_trips, concurrency
+        )
+
+    async def refresh_routes(
+        self, state: SyncState, concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> RefreshResult[RouteSummary]:
+        """Fetch only the routes that changed since the given state.
+
+        The route counterpart of refresh_trips(). Keep a separate state
+        for trips and routes. As there, a fresh SyncState() loads every
+        route through the paginated list.
+
+        Args:
+            state: Where the previous refresh left off.
+            concurrency: Maximum number of route requests in flight at once.
+
+        Returns:
+            The created/updated routes, the IDs of deleted routes, and the
+            state to pass to the next refresh.
+
+        Raises:
+            ValueError: If concurrency is less than 1.
+        """
+        return await self._refresh(
+            state, "route", self.get_route, self.get_routes, concurrency
+        )
+
+    async def _refresh[T](
+        self,
+        state: SyncState,
+        item_type: str,
+        fetch_one: Callable[[int], Awaitable[T]],
+        fetch_page: Callable[..., Awaitable[PaginatedResult[T]]],
+        concurrency: int,
+    ) -> RefreshResult[T]:
+        """Sync one asset type and fetch the records that changed.
+
+        Sync items are listed in the order the changes happened, so the
+        last action seen for an ID decides whether it was changed or
+        deleted. A record that 404s when fetched was deleted after the
+        sync call and is reported as deleted.
+
+        For the initial state, only the sync cursor is taken from the sync
+        response and every record is loaded page by page instead. The
+        cursor is read before the pages, so anything that changes during
+        the load is reported again by the next refresh rather than missed.
+        """
+        sync = await self.get_sync(state.cursor, assets=f"{item_type}s")
+        next_state = SyncState(cursor=sync.rwgps_datetime or state.cursor)
+
+        if state == _INITIAL_SYNC_STATE:
+            records = await self._fetch_all_pages(fetch_page, concurrency)
+            return RefreshResult(changed=records, deleted_ids=[], state=next_state)
+
+        latest_action: dict[int, str] = {}
+        for item in sync.items:
+            if item.item_type == item_type:
+                latest_action[item.item_id] = item.action
+
+        deleted_ids = []
+        changed_ids = []
+        for item_id, action in latest_action.items():
+            if action in _SYNC_REMOVED_ACTIONS:
+                deleted_ids.append(item_id)
+            else:
+                changed_ids.append(item_id)
+
+        async def fetch_if_exists(item_id: int) -> T | None:
+            try:
+                return await fetch_one(item_id)
+            except NotFoundError:
+                deleted_ids.append(item_id)
+                return None
+
+        fetched: list[T | None] = await self._gather_limited(
+            fetch_if_exists, changed_ids, concurrency
+        )
+        return RefreshResult(
+            changed=[record for record in fetched if record is not None],
+            deleted_ids=deleted_ids,
+            state=next_state,
+        )
+
+    # Parse a sync item dict from the API into a SyncItem dataclass.
+    # Generated from _SYNC_ITEM_FIELDS at import time; see _compile_parser().
+    _parse_sync_item = staticmethod(_compile_parser(SyncItem, _SYNC_ITEM_FIELDS))
+
     # -------------------------------------------------------------------------
     # Helpers
     # -------------------------------------------------------------------------
 
+    @staticmethod
+    async def _fetch_all_pages[T](
+        fetch_page: Callable[..., Awaitable[PaginatedResult[T]]],
+        max_concurrency: int,
+    ) -> list[T]:
+        """Collect every page of a paginated endpoint.
+
+        Page 1 is fetched on its own to learn page_count; pages 2..N are
+        then requested concurrently, at most max_concurrency at a time.
+        If the API doesn't report a page_count, falls back to following
+        next_page_url one page at a time.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+        """
+        # Checked up front, as small accounts never reach _gather_limited()
+        _check_limit(max_concurrency)
+        first = await fetch_page(page=1, page_size=200)
+        page_count = first.pagination.page_count
+
+        # Pre-size the result list from the record count reported with
+        # page 1, then copy each page into place, so the list never has to
+        # grow. Pages are placed back to back by their actual lengths; any
+        # unused slots (if records were deleted meanwhile) are trimmed at
+        # the end, and extra records (if some were added) extend the list.
+        record_count = first.pagination.record_count
+        all_items: list[T] = [None] * record_count  # type: ignore[list-item]
+        filled = len(first.items)
+        all_items[:filled] = first.items
+
+        if not page_count:
+            # No page count to plan with - walk the pages sequentially
+            result = first
+            page = 1
+            while result.pagination.next_page_url is not None:
+                page += 1
+                result = await fetch_page(page=page, page_size=200)
+                all_items[filled : filled + len(result.items)] = result.items
+                filled += len(result.items)
+        else:
+            # Results come back in page order, so pages are placed in sequence
+            results = await RideWithGPSClient._gather_limited(
+                lambda page: fetch_page(page=page, page_size=200),
+                range(2, page_count + 1),
+                max_concurrency,
+            )
+            for result in results:
+                all_items[filled : filled + len(result.items)] = result.items
+                filled += len(result.items)
+
+        del all_items[filled:]
+        return all_items
+
+    @staticmethod
+    async def _iter_pages[T](
+        fetch_page: Callable[..., Awaitable[PaginatedResult[T]]],
+        page_size: int,
+    ) -> AsyncIterator[T]:
+        """Yield the items of a paginated endpoint as each page arrives.
+
+        Follows next_page_url until the last page. The next page is only
+        requested once the caller has consumed the current one.
+        """
+        page = 1
+        while True:
+            result = await fetch_page(page=page, page_size=page_size)
+            for item in result.items:
+                yield item
+            # next_page_url is null when we've reached the last page
+            if result.pagination.next_page_url is None:
+                return
+            page += 1
+
+    @staticmethod
+    async def _gather_limited[A, R](
+        func: Callable[[A], Awaitable[R]], args: Iterable[A], limit: int
+    ) -> list[R]:
+        """Run func(arg) for every arg concurrently, at most limit at a time.
+
+        Returns the results in the same order as args. If any call fails,
+        the calls still pending or running are cancelled and the first
+        exception propagates to the caller (unwrapped from the
+        ExceptionGroup that TaskGroup raises).
+
+        Raises:
+            ValueError: If limit is less than 1 (a zero-slot semaphore would
+                wait forever).
+        """
+        _check_limit(limit)
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run(arg: A) -> R:
+            async with semaphore:
+                return await func(arg)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(run(arg)) for arg in args]
+        except ExceptionGroup as group_error:
+            raise group_error.exceptions[0] from None
+        return [task.result() for task in tasks]
+
     @staticmethod
     def _parse_pagination(meta: dict[str, Any]) -> PaginationMeta:
         """Parse pagination metadata from an API list response."""
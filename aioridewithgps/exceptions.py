@@ -4,6 +4,8 @@ These exceptions provide a clear hierarchy for handling different types
 of errors that can occur when communicating with the Ride with GPS API.
 """
 
+import aiohttp
+
 
 class RideWithGPSError(Exception):
     """Base exception for all Ride with GPS errors.
@@ -47,3 +49,13 @@ class ApiError(RideWithGPSError):
         self.status = status
         self.message = message
         super().__init__(f"API error {status}: {message}")
+
+
+class NetworkError(RideWithGPSError, aiohttp.ClientError):
+    """Raised when the API can't be reached or the connection fails.
+
+    Covers connection errors and timeouts from either HTTP backend
+    (aiohttp or httpx), so callers see the same exception whichever one
+    they use. Also an aiohttp.ClientError, so existing code that catches
+    that keeps working. The original error is available as __cause__.
+    """
@@ -1,6 +1,9 @@
 """Data models for the Ride with GPS API.
 
 These dataclasses represent the JSON responses from the RWGPS API.
+All models are slotted. Pure value types that are never changed after
+parsing (User, SyncItem, AuthToken, PaginationMeta) are also frozen;
+TripSummary and RouteSummary stay mutable so callers can annotate them.
 All measurement units match what the API returns:
   - Distance: meters
   - Elevation: meters
@@ -16,7 +19,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class User:
     """A Ride with GPS user account.
 
@@ -33,7 +36,7 @@ class User:
     updated_at: str  # ISO 8601 datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class TripSummary:
     """Summary of a recorded trip (ride).
 
@@ -111,7 +114,7 @@ class TripSummary:
     html_url: str | None = None  # Browser-viewable URL (with privacy_code if needed)
 
 
-@dataclass
+@dataclass(slots=True)
 class RouteSummary:
     """Summary of a planned route.
 
@@ -162,13 +165,14 @@ class RouteSummary:
     html_url: str | None = None  # Browser-viewable URL
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SyncItem:
     """A single change from the sync endpoint.
 
     The sync endpoint returns a list of these items describing what
     has changed since a given datetime. Used for efficient incremental
-    updates instead of re-fetching everything.
+    updates instead of re-fetching everything. Frozen (and so hashable),
+    which lets sync items be de-duplicated with a set.
     """
 
     item_type: str  # "route" or "trip"
@@ -179,7 +183,7 @@ class SyncItem:
     item_url: str | None = None  # API URL for the changed item
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncResult:
     """Complete response from the sync endpoint (GET /api/v1/sync.json).
 
@@ -191,7 +195,31 @@ class SyncResult:
     next_sync_url: str | None = None  # Pre-built URL for the next sync call
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class SyncState:
+    """Where an incremental refresh left off.
+
+    Pass the state returned by refresh_trips() / refresh_routes() into the
+    next call so only records changed since then are fetched. Persist the
+    cursor to resume across restarts.
+    """
+
+    cursor: str = "1970-01-01T00:00:00Z"  # Sync 'since' value (ISO 8601)
+
+
+@dataclass(slots=True)
+class RefreshResult[T]:
+    """The outcome of an incremental refresh via the sync endpoint.
+
+    Generic over T so it can hold TripSummary or RouteSummary.
+    """
+
+    changed: list[T]  # Records created or updated since the previous state
+    deleted_ids: list[int]  # IDs of records deleted since the previous state
+    state: SyncState  # Pass to the next refresh call
+
+
+@dataclass(slots=True, frozen=True)
 class AuthToken:
     """Authentication token returned by POST /api/v1/auth_tokens.json.
 
@@ -206,7 +234,7 @@ class AuthToken:
     updated_at: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PaginationMeta:
     """Pagination metadata included in list responses.
 
@@ -219,7 +247,7 @@ class PaginationMeta:
     next_page_url: str | None = None  # URL for next page, null if last page
 
 
-@dataclass
+@dataclass(slots=True)
 class PaginatedResult[T]:
     """A paginated API response wrapping a list of items.
 
@@ -0,0 +1,133 @@
+"""HTTP transports for the Ride with GPS client.
+
+The client talks to the API through a small transport interface so it can
+run on top of either HTTP library:
+  - aiohttp (default): HTTP/1.1, one TCP connection per in-flight request
+  - httpx (optional): HTTP/2, so concurrent page requests are multiplexed
+    over a single connection and TLS handshake
+
+Install the HTTP/2 backend with: pip install aioridewithgps[http2]
+
+Both transports raise NetworkError for connection failures and timeouts,
+so callers don't need to know which HTTP library is in use.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+import aiohttp
+from yarl import URL
+
+from .exceptions import NetworkError
+
+try:
+    import httpx
+except ImportError:  # httpx is optional (pip install aioridewithgps[http2])
+    httpx = None  # type: ignore[assignment]
+
+
+@dataclass(slots=True)
+class HttpResponse:
+    """A fully-read HTTP response, independent of the HTTP library used."""
+
+    status: int  # HTTP status code
+    headers: Mapping[str, str]  # Response headers (case-insensitive lookup)
+    body: bytes  # Raw response body
+
+    @property
+    def text(self) -> str:
+        """The response body decoded as text (used for error messages)."""
+        return self.body.decode("utf-8", errors="replace")
+
+
+class Transport(Protocol):
+    """The interface the client uses to send HTTP requests."""
+
+    async def request(
+        self,
+        method: str,
+        url: str | URL,
+        *,
+        headers: Mapping[str, str],
+        params: Mapping[str, Any] | None = None,
+        data: bytes | None = None,
+    ) -> HttpResponse:
+        """Send a request and return the fully-read response.
+
+        Raises:
+            NetworkError: If the request fails below the HTTP level
+                (connection error, timeout, ...).
+        """
+        ...
+
+
+class AiohttpTransport:
+    """Transport backed by an aiohttp ClientSession (HTTP/1.1)."""
+
+    def __init__(self, session: aiohttp.ClientSession) -> None:
+        """Wrap an existing aiohttp session. The caller still owns it."""
+        self._session = session
+
+    async def request(
+        self,
+        method: str,
+        url: str | URL,
+        *,
+        headers: Mapping[str, str],
+        params: Mapping[str, Any] | None = None,
+        data: bytes | None = None,
+    ) -> HttpResponse:
+        """Send a request through the aiohttp session."""
+        try:
+            async with self._session.request(
+                method, url, headers=headers, params=params, data=data
+            ) as resp:
+                return HttpResponse(resp.status, resp.headers, await resp.read())
+        except (aiohttp.ClientError, TimeoutError) as err:
+            raise NetworkError(f"Error communicating with the API: {err!r}") from err
+
+
+class HttpxTransport:
+    """Transport backed by an httpx AsyncClient (HTTP/2 when enabled)."""
+
+    def __init__(self, client: httpx.AsyncClient) -> None:
+        """Wrap an existing httpx client. The caller still owns it."""
+        self._client = client
+
+    async def request(
+        self,
+        method: str,
+        url: str | URL,
+        *,
+        headers: Mapping[str, str],
+        params: Mapping[str, Any] | None = None,
+        data: bytes | None = None,
+    ) -> HttpResponse:
+        """Send a request through the httpx client."""
+        try:
+            resp = await self._client.request(
+                method, str(url), headers=headers, params=params, content=data
+            )
+        except httpx.HTTPError as err:
+            raise NetworkError(f"Error communicating with the API: {err!r}") from err
+        return HttpResponse(resp.status_code, resp.headers, resp.content)
+
+
+def get_transport(session: aiohttp.ClientSession | httpx.AsyncClient) -> Transport:
+    """Pick the transport matching the type of session the caller passed in.
+
+    Raises:
+        TypeError: If the session is neither an aiohttp ClientSession nor
+            an httpx AsyncClient.
+    """
+    if isinstance(session, aiohttp.ClientSession):
+        return AiohttpTransport(session)
+    if httpx is not None and isinstance(session, httpx.AsyncClient):
+        return HttpxTransport(session)
+    raise TypeError(
+        "session must be an aiohttp.ClientSession or an httpx.AsyncClient, "
+        f"not {type(session).__name__}"
+    )